@@ -1 +1,2 @@
+from .api import AsyncExa as AsyncExa
 from .api import Exa as Exa
@@ -1,9 +1,12 @@
 from __future__ import annotations
 from dataclasses import dataclass
-import dataclasses
-from functools import wraps
-import re
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, wraps
+import string
 import requests
+from requests.adapters import HTTPAdapter, Retry
 from typing import (
     Callable,
     Iterable,
@@ -11,31 +14,65 @@ from typing import (
     Optional,
     Dict,
     Generic,
+    Tuple,
     TypeVar,
     overload,
     Union,
     Literal,
     get_origin,
     get_args,
+    AsyncIterator,
     Iterator,
+    TYPE_CHECKING,
 )
 from typing_extensions import TypedDict
 import json
 
-from openai import OpenAI
-from openai.types.chat.chat_completion_message_param import ChatCompletionMessageParam
-from openai.types.chat_model import ChatModel
 from exa_py.utils import (
-    ExaOpenAICompletion,
+    SearchResultCache,
+    add_context_to_messages,
     add_message_to_messages,
     format_exa_result,
+    maybe_get_last_user_message,
     maybe_get_query,
 )
 import os
 
+if TYPE_CHECKING:
+    # openai is only needed by wrap(), which imports it on first use.
+    from openai import AsyncOpenAI, OpenAI
+    from openai.types.chat.chat_completion_message_param import (
+        ChatCompletionMessageParam,
+    )
+    from openai.types.chat_model import ChatModel
+
+    from exa_py.completion import ExaOpenAICompletion
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib json module
+    orjson = None
+
 is_beta = os.getenv("IS_BETA") == "True"
 
+logger = logging.getLogger(__name__)
+
+if orjson is not None:
+
+    def json_dumps(data) -> bytes:
+        # Like the stdlib, refuse to serialize dataclasses (e.g. Result) implicitly.
+        return orjson.dumps(data, option=orjson.OPT_PASSTHROUGH_DATACLASS)
+
+    json_loads = orjson.loads
+else:
+
+    def json_dumps(data) -> bytes:
+        return json.dumps(data).encode("utf-8")
 
+    json_loads = json.loads
+
+
+@lru_cache(maxsize=1024)
 def snake_to_camel(snake_str: str) -> str:
     """Convert snake_case string to camelCase.
 
@@ -45,8 +82,13 @@ def snake_to_camel(snake_str: str) -> str:
     Returns:
         str: The string converted to camelCase format.
     """
+    if "_" not in snake_str:
+        return snake_str
     components = snake_str.split("_")
-    return components[0] + "".join(x.title() for x in components[1:])
+    for i in range(1, len(components)):
+        component = components[i]
+        components[i] = component[:1].upper() + component[1:]
+    return "".join(components)
 
 
 def to_camel_case(data: dict) -> dict:
@@ -61,13 +103,21 @@ def to_camel_case(data: dict) -> dict:
     """
     if isinstance(data, dict):
         return {
-            snake_to_camel(k): to_camel_case(v) if isinstance(v, dict) else v
+            (CAMEL_CASE_OPTION_KEYS.get(k) or snake_to_camel(k)): (
+                to_camel_case(v) if isinstance(v, dict) else v
+            )
             for k, v in data.items()
             if v is not None
         }
     return data
 
 
+ASCII_UPPERCASE = frozenset(string.ascii_uppercase)
+ASCII_LOWERCASE = frozenset(string.ascii_lowercase)
+ASCII_LOWERCASE_OR_DIGIT = ASCII_LOWERCASE | frozenset(string.digits)
+
+
+@lru_cache(maxsize=1024)
 def camel_to_snake(camel_str: str) -> str:
     """Convert camelCase string to snake_case.
 
@@ -77,8 +127,28 @@ def camel_to_snake(camel_str: str) -> str:
     Returns:
         str: The string converted to snake_case format.
     """
-    snake_str = re.sub("(.)([A-Z][a-z]+)", r"\1_\2", camel_str)
-    return re.sub("([a-z0-9])([A-Z])", r"\1_\2", snake_str).lower()
+    if camel_str.islower():
+        # No uppercase letters (e.g. "url", "title"): nothing to split or lower.
+        return camel_str
+    # Single scan equivalent to the former regex pair
+    # "(.)([A-Z][a-z]+)" -> "\1_\2" then "([a-z0-9])([A-Z])" -> "\1_\2":
+    # an uppercase letter gets a "_" before it when it follows a lowercase letter
+    # or digit, or when it starts a capitalized word ("HTMLTags" -> "html_tags").
+    chars = []
+    prev = ""
+    for i, char in enumerate(camel_str):
+        if (
+            i
+            and char in ASCII_UPPERCASE
+            and (
+                prev in ASCII_LOWERCASE_OR_DIGIT
+                or (prev != "\n" and camel_str[i + 1 : i + 2] in ASCII_LOWERCASE)
+            )
+        ):
+            chars.append("_")
+        chars.append(char)
+        prev = char
+    return "".join(chars).lower()
 
 
 def to_snake_case(data: dict) -> dict:
@@ -93,7 +163,9 @@ def to_snake_case(data: dict) -> dict:
     """
     if isinstance(data, dict):
         return {
-            camel_to_snake(k): to_snake_case(v) if isinstance(v, dict) else v
+            (SNAKE_CASE_RESULT_KEYS.get(k) or camel_to_snake(k)): (
+                to_snake_case(v) if isinstance(v, dict) else v
+            )
             for k, v in data.items()
         }
     return data
@@ -155,6 +227,73 @@ CONTENTS_ENDPOINT_OPTIONS_TYPES = {
     "flags": [list],  # We allow flags to be passed here too
 }
 
+# Merged tables for the endpoints that take several kinds of options, built once
+# instead of on every call.
+SEARCH_AND_CONTENTS_OPTIONS_TYPES = {
+    **SEARCH_OPTIONS_TYPES,
+    **CONTENTS_OPTIONS_TYPES,
+    **CONTENTS_ENDPOINT_OPTIONS_TYPES,
+}
+FIND_SIMILAR_AND_CONTENTS_OPTIONS_TYPES = {
+    **FIND_SIMILAR_OPTIONS_TYPES,
+    **CONTENTS_OPTIONS_TYPES,
+    **CONTENTS_ENDPOINT_OPTIONS_TYPES,
+}
+GET_CONTENTS_OPTIONS_TYPES = {**CONTENTS_OPTIONS_TYPES, **CONTENTS_ENDPOINT_OPTIONS_TYPES}
+# The Exa options a wrapped OpenAI create() can forward.
+WRAP_OPTIONS_TYPES = {**SEARCH_OPTIONS_TYPES, **CONTENTS_OPTIONS_TYPES}
+
+# Options that request page contents; when none is given, text is requested.
+CONTENTS_OPTION_KEYS = frozenset({"text", "highlights", "summary", "extras"})
+
+# Options (camelCase) that are sent nested under "contents" for search/findSimilar.
+CONTENTS_NEST_FIELDS = frozenset(
+    {
+        "text",
+        "highlights",
+        "summary",
+        "subpages",
+        "subpageTarget",
+        "livecrawl",
+        "livecrawlTimeout",
+        "extras",
+    }
+)
+
+
+def to_api_options(
+    options: Dict[str, Optional[object]], nest_contents: bool = False
+) -> dict:
+    """Build the request payload for an already-validated options dict.
+
+    Top-level keys are mapped through CAMEL_CASE_OPTION_KEYS instead of being
+    converted one by one, and None values are dropped. Nested option dicts
+    (e.g. `text={"max_characters": 100}`) are still converted with `to_camel_case`.
+
+    Args:
+        options (Dict[str, Optional[object]]): Validated options in snake_case.
+        nest_contents (bool, optional): Place the contents options (CONTENTS_NEST_FIELDS)
+            under a "contents" key, as /search and /findSimilar expect. Defaults to False.
+
+    Returns:
+        dict: The options with camelCase keys, ready to be sent to the API.
+    """
+    payload = {}
+    contents = {}
+    for k, v in options.items():
+        if v is None:
+            continue
+        key = CAMEL_CASE_OPTION_KEYS[k]
+        if isinstance(v, dict):
+            v = to_camel_case(v)
+        if nest_contents and key in CONTENTS_NEST_FIELDS:
+            contents[key] = v
+        else:
+            payload[key] = v
+    if nest_contents:
+        payload["contents"] = contents
+    return payload
+
 
 def validate_search_options(
     options: Dict[str, Optional[object]], expected: dict
@@ -168,24 +307,59 @@ def validate_search_options(
     Raises:
         ValueError: If an invalid option or option type is provided.
     """
+    validators = compile_validators(expected)
     for key, value in options.items():
-        if key not in expected:
+        validator = validators.get(key)
+        if validator is None:
             raise ValueError(f"Invalid option: '{key}'")
         if value is None:
             continue
-        expected_types = expected[key]
-        if not any(is_valid_type(value, t) for t in expected_types):
+        if not validator(value):
             raise ValueError(
-                f"Invalid value for option '{key}': {value}. Expected one of {expected_types}"
+                f"Invalid value for option '{key}': {value}. Expected one of {expected[key]}"
             )
 
 
-def is_valid_type(value, expected_type):
-    if get_origin(expected_type) is Literal:
-        return value in get_args(expected_type)
-    if isinstance(expected_type, type):
-        return isinstance(value, expected_type)
-    return False  # For any other case
+def compile_validator(expected_types: list) -> Callable[[object], bool]:
+    """Build a single check that a value matches any of `expected_types`.
+
+    Classes are checked with isinstance and Literal types by membership. The `typing`
+    introspection happens here, once, rather than for every value.
+    """
+    classes = tuple(t for t in expected_types if isinstance(t, type))
+    literals = tuple(
+        value
+        for t in expected_types
+        if get_origin(t) is Literal
+        for value in get_args(t)
+    )
+    if not literals:
+        return lambda value: isinstance(value, classes)
+    return lambda value: value in literals or isinstance(value, classes)
+
+
+# Compiled checks for each options table, keyed by the table's identity. The table
+# itself is kept alongside so its id can't be reused by another dict.
+_OPTION_VALIDATORS: Dict[int, tuple] = {}
+
+
+def compile_validators(expected: dict) -> Dict[str, Callable[[object], bool]]:
+    """Return the compiled check for every key of an options table, building them on first use.
+
+    Args:
+        expected (dict): The expected types for each option.
+
+    Returns:
+        Dict[str, Callable[[object], bool]]: One check per option key.
+    """
+    cached = _OPTION_VALIDATORS.get(id(expected))
+    if cached is None or cached[0] is not expected:
+        cached = (
+            expected,
+            {key: compile_validator(types) for key, types in expected.items()},
+        )
+        _OPTION_VALIDATORS[id(expected)] = cached
+    return cached[1]
 
 
 class TextContentsOptions(TypedDict, total=False):
@@ -231,6 +405,24 @@ class ExtrasOptions(TypedDict, total=False):
     image_links: int
 
 
+# camelCase name the API expects for every option key the SDK accepts, including
+# the keys of the nested contents options above.
+CAMEL_CASE_OPTION_KEYS = {
+    key: snake_to_camel(key)
+    for options_types in (
+        SEARCH_OPTIONS_TYPES,
+        FIND_SIMILAR_OPTIONS_TYPES,
+        CONTENTS_OPTIONS_TYPES,
+        CONTENTS_ENDPOINT_OPTIONS_TYPES,
+        TextContentsOptions.__annotations__,
+        HighlightsContentsOptions.__annotations__,
+        SummaryContentsOptions.__annotations__,
+        ExtrasOptions.__annotations__,
+    )
+    for key in options_types
+}
+
+
 @dataclass
 class _Result:
     """A class representing the base fields of a search result.
@@ -248,16 +440,29 @@ class _Result:
         extras (Dict, optional): Additional metadata; e.g. links, images.
     """
 
+    __slots__ = (
+        "url",
+        "id",
+        "title",
+        "score",
+        "published_date",
+        "author",
+        "image",
+        "favicon",
+        "subpages",
+        "extras",
+    )
+
     url: str
     id: str
-    title: Optional[str] = None
-    score: Optional[float] = None
-    published_date: Optional[str] = None
-    author: Optional[str] = None
-    image: Optional[str] = None
-    favicon: Optional[str] = None
-    subpages: Optional[List[_Result]] = None
-    extras: Optional[Dict] = None
+    title: Optional[str]
+    score: Optional[float]
+    published_date: Optional[str]
+    author: Optional[str]
+    image: Optional[str]
+    favicon: Optional[str]
+    subpages: Optional[List[_Result]]
+    extras: Optional[Dict]
 
     def __init__(self, **kwargs):
         self.url = kwargs["url"]
@@ -298,10 +503,12 @@ class Result(_Result):
         summary (str, optional)
     """
 
-    text: Optional[str] = None
-    highlights: Optional[List[str]] = None
-    highlight_scores: Optional[List[float]] = None
-    summary: Optional[str] = None
+    __slots__ = ("text", "highlights", "highlight_scores", "summary")
+
+    text: Optional[str]
+    highlights: Optional[List[str]]
+    highlight_scores: Optional[List[float]]
+    summary: Optional[str]
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -310,6 +517,31 @@ class Result(_Result):
         self.highlight_scores = kwargs.get("highlight_scores")
         self.summary = kwargs.get("summary")
 
+    @classmethod
+    def from_api(cls, data: dict) -> "Result":
+        """Build a Result from a camelCase result returned by the API.
+
+        Fields are read by their API names and set on a new instance directly,
+        skipping the keyword-argument __init__ chain.
+        """
+        result = cls.__new__(cls)
+        result.url = data["url"]
+        result.id = data["id"]
+        result.title = data.get("title")
+        result.score = data.get("score")
+        result.published_date = data.get("publishedDate")
+        result.author = data.get("author")
+        result.image = data.get("image")
+        result.favicon = data.get("favicon")
+        result.subpages = data.get("subpages")
+        extras = data.get("extras")
+        result.extras = to_snake_case(extras) if isinstance(extras, dict) else extras
+        result.text = data.get("text")
+        result.highlights = data.get("highlights")
+        result.highlight_scores = data.get("highlightScores")
+        result.summary = data.get("summary")
+        return result
+
     def __str__(self):
         base_str = super().__str__()
         return base_str + (
@@ -329,7 +561,9 @@ class ResultWithText(_Result):
         text (str): The text of the search result page.
     """
 
-    text: str = dataclasses.field(default_factory=str)
+    __slots__ = ("text",)
+
+    text: str
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -350,8 +584,10 @@ class ResultWithHighlights(_Result):
         highlight_scores (List[float])
     """
 
-    highlights: List[str] = dataclasses.field(default_factory=list)
-    highlight_scores: List[float] = dataclasses.field(default_factory=list)
+    __slots__ = ("highlights", "highlight_scores")
+
+    highlights: List[str]
+    highlight_scores: List[float]
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -377,9 +613,11 @@ class ResultWithTextAndHighlights(_Result):
         highlight_scores (List[float])
     """
 
-    text: str = dataclasses.field(default_factory=str)
-    highlights: List[str] = dataclasses.field(default_factory=list)
-    highlight_scores: List[float] = dataclasses.field(default_factory=list)
+    __slots__ = ("text", "highlights", "highlight_scores")
+
+    text: str
+    highlights: List[str]
+    highlight_scores: List[float]
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -405,7 +643,9 @@ class ResultWithSummary(_Result):
         summary (str)
     """
 
-    summary: str = dataclasses.field(default_factory=str)
+    __slots__ = ("summary",)
+
+    summary: str
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -426,8 +666,10 @@ class ResultWithTextAndSummary(_Result):
         summary (str)
     """
 
-    text: str = dataclasses.field(default_factory=str)
-    summary: str = dataclasses.field(default_factory=str)
+    __slots__ = ("text", "summary")
+
+    text: str
+    summary: str
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -450,9 +692,11 @@ class ResultWithHighlightsAndSummary(_Result):
         summary (str)
     """
 
-    highlights: List[str] = dataclasses.field(default_factory=list)
-    highlight_scores: List[float] = dataclasses.field(default_factory=list)
-    summary: str = dataclasses.field(default_factory=str)
+    __slots__ = ("highlights", "highlight_scores", "summary")
+
+    highlights: List[str]
+    highlight_scores: List[float]
+    summary: str
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -481,10 +725,12 @@ class ResultWithTextAndHighlightsAndSummary(_Result):
         summary (str)
     """
 
-    text: str = dataclasses.field(default_factory=str)
-    highlights: List[str] = dataclasses.field(default_factory=list)
-    highlight_scores: List[float] = dataclasses.field(default_factory=list)
-    summary: str = dataclasses.field(default_factory=str)
+    __slots__ = ("text", "highlights", "highlight_scores", "summary")
+
+    text: str
+    highlights: List[str]
+    highlight_scores: List[float]
+    summary: str
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -503,6 +749,13 @@ class ResultWithTextAndHighlightsAndSummary(_Result):
         )
 
 
+# snake_case name for every camelCase key a search result (or its extras) can carry.
+SNAKE_CASE_RESULT_KEYS = {
+    snake_to_camel(key): key
+    for key in (*Result.__dataclass_fields__, *ExtrasOptions.__annotations__)
+}
+
+
 @dataclass
 class AnswerResult:
     """A class representing a result for an answer.
@@ -515,12 +768,14 @@ class AnswerResult:
         author (str, optional): If available, the author of the content.
         text (str, optional): The full page text from each search result.
     """
-    id: str 
+    __slots__ = ("id", "url", "title", "published_date", "author", "text")
+
+    id: str
     url: str
-    title: Optional[str] = None
-    published_date: Optional[str] = None
-    author: Optional[str] = None
-    text: Optional[str] = None
+    title: Optional[str]
+    published_date: Optional[str]
+    author: Optional[str]
+    text: Optional[str]
 
     def __init__(self, **kwargs):
         self.id = kwargs['id']
@@ -530,6 +785,18 @@ class AnswerResult:
         self.author = kwargs.get('author')  
         self.text = kwargs.get('text')
 
+    @classmethod
+    def from_api(cls, data: dict) -> "AnswerResult":
+        """Build an AnswerResult from a camelCase citation returned by the API."""
+        result = cls.__new__(cls)
+        result.id = data["id"]
+        result.url = data["url"]
+        result.title = data.get("title")
+        result.published_date = data.get("publishedDate")
+        result.author = data.get("author")
+        result.text = data.get("text")
+        return result
+
     def __str__(self):
         return (
             f"Title: {self.title}\n"
@@ -539,7 +806,8 @@ class AnswerResult:
             f"Author: {self.author}\n"
             f"Text: {self.text}\n\n"
         )
-    
+
+
 @dataclass
 class StreamChunk:
     """A class representing a single chunk of streaming data.
@@ -576,6 +844,8 @@ class AnswerResponse:
         citations (List[AnswerResult]): A list of citations used to generate the answer.
     """
 
+    __slots__ = ("answer", "citations")
+
     answer: str
     citations: List[AnswerResult]
 
@@ -608,10 +878,13 @@ class StreamAnswerResponse:
         for line in self._raw_response.iter_lines():
             if not line:
                 continue
-            decoded_line = line.decode("utf-8").removeprefix("data: ")
+            # SSE payload lines look like b"data: {...}". json_loads takes the bytes
+            # (and the leading space) directly, so skip the per-line decode/copy.
+            if line.startswith(b"data:"):
+                line = line[5:]
             try:
-                chunk = json.loads(decoded_line)
-            except json.JSONDecodeError:
+                chunk = json_loads(line)
+            except json.JSONDecodeError:  # also raised by orjson
                 continue
 
             content = None
@@ -622,7 +895,7 @@ class StreamAnswerResponse:
                     content = chunk["choices"][0]["delta"].get("content")
 
             if "citations" in chunk and chunk["citations"] and chunk["citations"] != "null":
-                citations = [AnswerResult(**to_snake_case(s)) for s in chunk["citations"]]
+                citations = [AnswerResult.from_api(s) for s in chunk["citations"]]
 
             stream_chunk = StreamChunk(content=content, citations=citations)
             if stream_chunk.has_data():
@@ -647,11 +920,23 @@ class SearchResponse(Generic[T]):
         auto_date (str, optional): A date for filtering if autoprompt found one.
     """
 
+    __slots__ = ("results", "autoprompt_string", "resolved_search_type", "auto_date")
+
     results: List[T]
     autoprompt_string: Optional[str]
     resolved_search_type: Optional[str]
     auto_date: Optional[str]
 
+    @classmethod
+    def from_api(cls, data: dict) -> "SearchResponse[Result]":
+        """Build a SearchResponse from a camelCase response returned by the API."""
+        return cls(
+            [Result.from_api(result) for result in data["results"]],
+            data.get("autopromptString"),
+            data.get("resolvedSearchType"),
+            data.get("autoDate"),
+        )
+
     def __str__(self):
         output = "\n\n".join(str(result) for result in self.results)
         if self.autoprompt_string:
@@ -662,21 +947,48 @@ class SearchResponse(Generic[T]):
         return output
 
 
-def nest_fields(original_dict: Dict, fields_to_nest: List[str], new_key: str):
-    # Create a new dictionary to store the nested fields
-    nested_dict = {}
+# OpenAI tool definition that lets the model request an Exa search. A tuple so the
+# shared schema can't be appended to; treat the nested dicts as read-only too.
+EXA_SEARCH_TOOLS = (
+    {
+        "type": "function",
+        "function": {
+            "name": "search",
+            "description": "Search the web for relevant information.",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "query": {
+                        "type": "string",
+                        "description": "The query to search for.",
+                    },
+                },
+                "required": ["query"],
+            },
+        },
+    },
+)
 
-    # Iterate over the fields to be nested
-    for field in fields_to_nest:
-        # Check if the field exists in the original dictionary
-        if field in original_dict:
-            # Move the field to the nested dictionary
-            nested_dict[field] = original_dict.pop(field)
+# Forces the model to call the search tool above, for use_exa="required".
+SEARCH_TOOL_CHOICE = {"type": "function", "function": {"name": "search"}}
 
-    # Add the nested dictionary to the original dictionary under the new key
-    original_dict[new_key] = nested_dict
 
-    return original_dict
+# Longest wait, in seconds, honoured for a Retry-After header before a retry.
+RETRY_AFTER_MAX = 10.0
+
+
+class _CappedRetry(Retry):
+    """Retry policy that waits at most RETRY_AFTER_MAX seconds for a Retry-After header.
+
+    Older urllib3 releases have no cap and newer ones default to six hours, so a
+    response asking for a long wait would otherwise stall the caller for that long.
+    """
+
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, RETRY_AFTER_MAX)
 
 
 class Exa:
@@ -687,12 +999,25 @@ class Exa:
         api_key: Optional[str],
         base_url: str = "https://api.exa.ai",
         user_agent: str = "exa-py 1.8.7",
+        retrieval_cache_size: int = 0,
+        retrieval_cache_ttl: Optional[float] = None,
+        max_connections: int = 100,
+        timeout: Optional[float] = None,
     ):
         """Initialize the Exa client with the provided API key and optional base URL and user agent.
 
         Args:
             api_key (str): The API key for authenticating with the Exa API.
             base_url (str, optional): The base URL for the Exa API. Defaults to "https://api.exa.ai".
+            retrieval_cache_size (int, optional): How many searches made by wrapped OpenAI clients
+                to cache by query and options. Completions answered from the cache share its
+                Result objects, so treat `exa_result` as read-only. Defaults to 0 (disabled).
+            retrieval_cache_ttl (float, optional): Seconds before a cached search expires.
+                Defaults to None (entries are only evicted when the cache is full).
+            max_connections (int, optional): Most connections kept open to a single host,
+                e.g. when the client is shared across threads. Defaults to 100.
+            timeout (float, optional): Seconds to wait for the API to accept a connection
+                or send data before giving up. Defaults to None (wait indefinitely).
         """
         if api_key is None:
             import os
@@ -703,7 +1028,51 @@ class Exa:
                     "API key must be provided as an argument or in EXA_API_KEY environment variable"
                 )
         self.base_url = base_url
+        self.timeout = timeout
         self.headers = {"x-api-key": api_key, "User-Agent": user_agent}
+        # One session per client so consecutive calls reuse pooled keep-alive
+        # connections instead of opening a new TCP/TLS connection each time.
+        self._session = requests.Session()
+        # Every request body is JSON; set the header once rather than copying
+        # self.headers into a new dict per call. requests already asks for
+        # gzip/deflate-encoded responses by default.
+        self._session.headers["Content-Type"] = "application/json"
+        # Size the pool for clients shared across threads; the default adapter
+        # keeps at most 10 connections per host. Failed connection attempts, and
+        # 429/503 responses saying the API is rate limited or unavailable, are
+        # retried with backoff. 502/504 are not retried: the gateway may already
+        # have passed the request on, so sending it again could run it twice.
+        adapter = HTTPAdapter(
+            pool_maxsize=max_connections,
+            max_retries=_CappedRetry(
+                total=2,
+                read=0,
+                other=0,
+                backoff_factor=0.2,
+                status_forcelist=(429, 503),
+                allowed_methods=None,
+                raise_on_status=False,
+            ),
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        self._retrieval_cache = SearchResultCache(
+            maxsize=retrieval_cache_size, ttl=retrieval_cache_ttl
+        )
+
+    def close(self) -> None:
+        """Close the underlying HTTP session and release pooled connections."""
+        self._session.close()
+
+    def clear_retrieval_cache(self) -> None:
+        """Drop all searches cached for wrapped OpenAI clients."""
+        self._retrieval_cache.clear()
+
+    def __enter__(self) -> "Exa":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
     def request(self, endpoint: str, data):
         """Send a POST request to the Exa API, optionally streaming if data['stream'] is True.
@@ -719,14 +1088,24 @@ class Exa:
         Raises:
             ValueError: If the request fails (non-200 status code).
         """
+        # Serialize ourselves so orjson (when installed) is used in both directions.
+        body = json_dumps(data)
         if data.get("stream"):
-            res = requests.post(self.base_url + endpoint, json=data, headers=self.headers, stream=True)
+            res = self._session.post(
+                self.base_url + endpoint,
+                data=body,
+                headers=self.headers,
+                stream=True,
+                timeout=self.timeout,
+            )
             return res
 
-        res = requests.post(self.base_url + endpoint, json=data, headers=self.headers)
+        res = self._session.post(
+            self.base_url + endpoint, data=body, headers=self.headers, timeout=self.timeout
+        )
         if res.status_code != 200:
             raise ValueError(f"Request failed with status code {res.status_code}: {res.text}")
-        return res.json()
+        return json_loads(res.content)
 
     def search(
         self,
@@ -769,16 +1148,48 @@ class Exa:
         Returns:
             SearchResponse: The response containing search results, etc.
         """
-        options = {k: v for k, v in locals().items() if k != "self" and v is not None}
+        options = {
+            k: v
+            for k, v in (
+                ("query", query),
+                ("num_results", num_results),
+                ("include_domains", include_domains),
+                ("exclude_domains", exclude_domains),
+                ("start_crawl_date", start_crawl_date),
+                ("end_crawl_date", end_crawl_date),
+                ("start_published_date", start_published_date),
+                ("end_published_date", end_published_date),
+                ("include_text", include_text),
+                ("exclude_text", exclude_text),
+                ("use_autoprompt", use_autoprompt),
+                ("type", type),
+                ("category", category),
+                ("flags", flags),
+                ("moderation", moderation),
+            )
+            if v is not None
+        }
         validate_search_options(options, SEARCH_OPTIONS_TYPES)
-        options = to_camel_case(options)
+        options = to_api_options(options)
         data = self.request("/search", options)
-        return SearchResponse(
-            [Result(**to_snake_case(result)) for result in data["results"]],
-            data["autopromptString"] if "autopromptString" in data else None,
-            data["resolvedSearchType"] if "resolvedSearchType" in data else None,
-            data["autoDate"] if "autoDate" in data else None,
-        )
+        return SearchResponse.from_api(data)
+
+    def search_many(
+        self, queries: List[str], max_workers: int = 16, **kwargs
+    ) -> List[SearchResponse[_Result]]:
+        """Run `search` for several queries concurrently, keeping input order.
+
+        Args:
+            queries (List[str]): The queries to search for.
+            max_workers (int): Maximum number of requests in flight. Defaults to 16.
+            **kwargs: Options passed to every `search` call.
+
+        Returns:
+            List[SearchResponse]: One response per query.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(self.search, query, **kwargs) for query in queries]
+            return [future.result() for future in futures]
 
     @overload
     def search_and_contents(
@@ -1017,48 +1428,21 @@ class Exa:
         ...
 
     def search_and_contents(self, query: str, **kwargs):
-        options = {k: v for k, v in {"query": query, **kwargs}.items() if v is not None}
+        options = {"query": query}
+        options.update((k, v) for k, v in kwargs.items() if v is not None)
         # If user didn't ask for any particular content, default to text
-        if (
-            "text" not in options
-            and "highlights" not in options
-            and "summary" not in options
-            and "extras" not in options
-        ):
+        if CONTENTS_OPTION_KEYS.isdisjoint(options):
             options["text"] = True
 
-        validate_search_options(
-            options,
-            {
-                **SEARCH_OPTIONS_TYPES,
-                **CONTENTS_OPTIONS_TYPES,
-                **CONTENTS_ENDPOINT_OPTIONS_TYPES,
-            },
-        )
+        validate_search_options(options, SEARCH_AND_CONTENTS_OPTIONS_TYPES)
+        return self._search_and_contents(options)
 
-        # Nest the appropriate fields under "contents"
-        options = nest_fields(
-            options,
-            [
-                "text",
-                "highlights",
-                "summary",
-                "subpages",
-                "subpage_target",
-                "livecrawl",
-                "livecrawl_timeout",
-                "extras",
-            ],
-            "contents",
-        )
-        options = to_camel_case(options)
-        data = self.request("/search", options)
-        return SearchResponse(
-            [Result(**to_snake_case(result)) for result in data["results"]],
-            data["autopromptString"] if "autopromptString" in data else None,
-            data["resolvedSearchType"] if "resolvedSearchType" in data else None,
-            data["autoDate"] if "autoDate" in data else None,
-        )
+    def _search_and_contents(
+        self, options: Dict[str, object]
+    ) -> SearchResponse[Result]:
+        """Send options that have already been validated to /search, with contents."""
+        data = self.request("/search", to_api_options(options, nest_contents=True))
+        return SearchResponse.from_api(data)
 
     @overload
     def get_contents(
@@ -1191,32 +1575,24 @@ class Exa:
     ) -> SearchResponse[ResultWithTextAndHighlightsAndSummary]:
         ...
 
-    def get_contents(self, urls: Union[str, List[str], List[_Result]], **kwargs):
-        options = {
-            k: v
-            for k, v in {"urls": urls, **kwargs}.items()
-            if k != "self" and v is not None
-        }
-        if (
-            "text" not in options
-            and "highlights" not in options
-            and "summary" not in options
-            and "extras" not in options
-        ):
+    def get_contents(self, urls: Union[str, Iterable[str], Iterable[_Result]], **kwargs):
+        # Accept a single URL, or any iterable of URLs or results of an earlier search.
+        # A list of URL strings is sent as is, without copying it.
+        if isinstance(urls, str):
+            urls = [urls]
+        elif isinstance(urls, list) and all(isinstance(url, str) for url in urls):
+            pass
+        elif urls is not None:
+            urls = [getattr(url, "url", url) for url in urls]
+        options = {"urls": urls}
+        options.update((k, v) for k, v in kwargs.items() if v is not None)
+        if CONTENTS_OPTION_KEYS.isdisjoint(options):
             options["text"] = True
 
-        validate_search_options(
-            options,
-            {**CONTENTS_OPTIONS_TYPES, **CONTENTS_ENDPOINT_OPTIONS_TYPES},
-        )
-        options = to_camel_case(options)
+        validate_search_options(options, GET_CONTENTS_OPTIONS_TYPES)
+        options = to_api_options(options)
         data = self.request("/contents", options)
-        return SearchResponse(
-            [Result(**to_snake_case(result)) for result in data["results"]],
-            data.get("autopromptString"),
-            data.get("resolvedSearchType"),
-            data.get("autoDate"),
-        )
+        return SearchResponse.from_api(data)
 
     def find_similar(
         self,
@@ -1255,16 +1631,29 @@ class Exa:
         Returns:
             SearchResponse[_Result]
         """
-        options = {k: v for k, v in locals().items() if k != "self" and v is not None}
+        options = {
+            k: v
+            for k, v in (
+                ("url", url),
+                ("num_results", num_results),
+                ("include_domains", include_domains),
+                ("exclude_domains", exclude_domains),
+                ("start_crawl_date", start_crawl_date),
+                ("end_crawl_date", end_crawl_date),
+                ("start_published_date", start_published_date),
+                ("end_published_date", end_published_date),
+                ("include_text", include_text),
+                ("exclude_text", exclude_text),
+                ("exclude_source_domain", exclude_source_domain),
+                ("category", category),
+                ("flags", flags),
+            )
+            if v is not None
+        }
         validate_search_options(options, FIND_SIMILAR_OPTIONS_TYPES)
-        options = to_camel_case(options)
+        options = to_api_options(options)
         data = self.request("/findSimilar", options)
-        return SearchResponse(
-            [Result(**to_snake_case(result)) for result in data["results"]],
-            data.get("autopromptString"),
-            data.get("resolvedSearchType"),
-            data.get("autoDate"),
-        )
+        return SearchResponse.from_api(data)
 
     @overload
     def find_similar_and_contents(
@@ -1487,65 +1876,45 @@ class Exa:
         ...
 
     def find_similar_and_contents(self, url: str, **kwargs):
-        options = {k: v for k, v in {"url": url, **kwargs}.items() if v is not None}
+        options = {"url": url}
+        options.update((k, v) for k, v in kwargs.items() if v is not None)
         # Default to text if none specified
-        if (
-            "text" not in options
-            and "highlights" not in options
-            and "summary" not in options
-        ):
+        if CONTENTS_OPTION_KEYS.isdisjoint(options):
             options["text"] = True
 
-        validate_search_options(
-            options,
-            {
-                **FIND_SIMILAR_OPTIONS_TYPES,
-                **CONTENTS_OPTIONS_TYPES,
-                **CONTENTS_ENDPOINT_OPTIONS_TYPES,
-            },
-        )
-        # We nest the content fields
-        options = nest_fields(
-            options,
-            [
-                "text",
-                "highlights",
-                "summary",
-                "subpages",
-                "subpage_target",
-                "livecrawl",
-                "livecrawl_timeout",
-                "extras",
-            ],
-            "contents",
-        )
-        options = to_camel_case(options)
+        validate_search_options(options, FIND_SIMILAR_AND_CONTENTS_OPTIONS_TYPES)
+        options = to_api_options(options, nest_contents=True)
         data = self.request("/findSimilar", options)
-        return SearchResponse(
-            [Result(**to_snake_case(result)) for result in data["results"]],
-            data.get("autopromptString"),
-            data.get("resolvedSearchType"),
-            data.get("autoDate"),
-        )
+        return SearchResponse.from_api(data)
 
-    def wrap(self, client: OpenAI):
+    def wrap(self, client: Union[OpenAI, AsyncOpenAI]):
         """Wrap an OpenAI client with Exa functionality.
 
         After wrapping, any call to `client.chat.completions.create` will be intercepted 
         and enhanced with Exa RAG functionality. To disable Exa for a specific call, 
-        set `use_exa="none"` in the `create` method.
+        set `use_exa="none"` in the `create` method. With `use_exa="required"`, the last
+        user message is searched directly and the model is called once with the results.
+
+        An `AsyncOpenAI` client can be wrapped as well, in which case `create` must be
+        awaited and many wrapped completions can run concurrently.
+
+        Wrapping also adds `client.chat.completions.create_many(batch)`, which runs a
+        list of `create` keyword-argument dicts concurrently and returns the completions
+        in the same order.
 
         Args:
-            client (OpenAI): The OpenAI client to wrap.
+            client (Union[OpenAI, AsyncOpenAI]): The OpenAI client to wrap.
 
         Returns:
-            OpenAI: The wrapped OpenAI client.
+            Union[OpenAI, AsyncOpenAI]: The wrapped OpenAI client.
         """
+        from openai import AsyncOpenAI
 
         func = client.chat.completions.create
 
-        @wraps(func)
-        def create_with_rag(
+        # Validates a wrapped create() call and collects the arguments for
+        # _create_with_tool / _acreate_with_tool.
+        def prepare_create(
             # Mandatory OpenAI args
             messages: Iterable[ChatCompletionMessageParam],
             model: Union[str, ChatModel],
@@ -1570,40 +1939,102 @@ class Exa:
             **openai_kwargs,
         ):
             exa_kwargs = {
-                "num_results": num_results,
-                "include_domains": include_domains,
-                "exclude_domains": exclude_domains,
-                "highlights": highlights,
-                "start_crawl_date": start_crawl_date,
-                "end_crawl_date": end_crawl_date,
-                "start_published_date": start_published_date,
-                "end_published_date": end_published_date,
-                "include_text": include_text,
-                "exclude_text": exclude_text,
-                "use_autoprompt": use_autoprompt,
-                "type": type,
-                "category": category,
-                "flags": flags,
+                k: v
+                for k, v in (
+                    ("num_results", num_results),
+                    ("include_domains", include_domains),
+                    ("exclude_domains", exclude_domains),
+                    ("highlights", highlights),
+                    ("start_crawl_date", start_crawl_date),
+                    ("end_crawl_date", end_crawl_date),
+                    ("start_published_date", start_published_date),
+                    ("end_published_date", end_published_date),
+                    ("include_text", include_text),
+                    ("exclude_text", exclude_text),
+                    ("use_autoprompt", use_autoprompt),
+                    ("type", type),
+                    ("category", category),
+                    ("flags", flags),
+                )
+                if v is not None
             }
+            # Reject bad Exa options before spending a model call on them.
+            if use_exa != "none":
+                validate_search_options(exa_kwargs, WRAP_OPTIONS_TYPES)
 
-            create_kwargs = {
-                "model": model,
-                **openai_kwargs,
-            }
+            # openai_kwargs is this call's own **kwargs dict, so add the model to it
+            # instead of copying every option into a new one.
+            create_kwargs = openai_kwargs
+            create_kwargs["model"] = model
+
+            # Only materialize non-list iterables; the caller's list is never mutated
+            # (add_message_to_messages copies it only when a search actually runs).
+            if not isinstance(messages, list):
+                messages = list(messages)
 
-            return self._create_with_tool(
+            return dict(
                 create_fn=func,
-                messages=list(messages),
+                messages=messages,
                 max_len=result_max_len,
                 create_kwargs=create_kwargs,
                 exa_kwargs=exa_kwargs,
+                use_exa=use_exa,
             )
 
-        print("Wrapping OpenAI client with Exa functionality.")
+        if isinstance(client, AsyncOpenAI):
+
+            @wraps(func)
+            async def create_with_rag(*args, **kwargs):
+                return await self._acreate_with_tool(**prepare_create(*args, **kwargs))
+
+            async def create_many_with_rag(batch: List[dict]) -> list:
+                """Run several wrapped `create` calls concurrently, keeping input order.
+
+                Args:
+                    batch (List[dict]): Keyword arguments for each `create` call.
+                """
+                return list(await asyncio.gather(*[create_with_rag(**kwargs) for kwargs in batch]))
+
+        else:
+
+            @wraps(func)
+            def create_with_rag(*args, **kwargs):
+                return self._create_with_tool(**prepare_create(*args, **kwargs))
+
+            def create_many_with_rag(batch: List[dict], max_workers: int = 16) -> list:
+                """Run several wrapped `create` calls concurrently, keeping input order.
+
+                Identical searches running at the same time are only sent to Exa once.
+
+                Args:
+                    batch (List[dict]): Keyword arguments for each `create` call.
+                    max_workers (int): Maximum number of calls in flight. Defaults to 16.
+                """
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    futures = [executor.submit(create_with_rag, **kwargs) for kwargs in batch]
+                    return [future.result() for future in futures]
+
+        logger.info("Wrapping OpenAI client with Exa functionality.")
         client.chat.completions.create = create_with_rag  # type: ignore
+        client.chat.completions.create_many = create_many_with_rag  # type: ignore
 
         return client
 
+    @staticmethod
+    def _tool_call_kwargs(
+        create_kwargs: dict,
+        use_exa: Optional[Literal["required", "none", "auto"]],
+    ) -> Tuple[dict, dict]:
+        """Build the kwargs for the model call offering the search tool, and for the follow-up call.
+
+        With use_exa="required" there was no user text to search directly, so the first
+        call is made to use the tool; the follow-up call answers with the results.
+        """
+        followup_kwargs = {**create_kwargs, "tools": EXA_SEARCH_TOOLS}
+        if use_exa != "required":
+            return followup_kwargs, followup_kwargs
+        return {**followup_kwargs, "tool_choice": SEARCH_TOOL_CHOICE}, followup_kwargs
+
     def _create_with_tool(
         self,
         create_fn: Callable,
@@ -1611,30 +2042,31 @@ class Exa:
         max_len,
         create_kwargs,
         exa_kwargs,
+        use_exa: Optional[Literal["required", "none", "auto"]] = "auto",
     ) -> ExaOpenAICompletion:
-        tools = [
-            {
-                "type": "function",
-                "function": {
-                    "name": "search",
-                    "description": "Search the web for relevant information.",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "query": {
-                                "type": "string",
-                                "description": "The query to search for.",
-                            },
-                        },
-                        "required": ["query"],
-                    },
-                },
-            }
-        ]
+        from exa_py.completion import ExaOpenAICompletion
+
+        if use_exa == "none":
+            completion = create_fn(messages=messages, **create_kwargs)
+            return ExaOpenAICompletion.from_completion(
+                completion=completion, exa_result=None
+            )
+
+        if use_exa == "required":
+            # The last user message is the query, so search first and call the model
+            # once, skipping the tool-call roundtrip.
+            query = maybe_get_last_user_message(messages)
+            if query:
+                exa_result, exa_str = self._search_and_format(query, exa_kwargs, max_len)
+                new_messages = add_context_to_messages(messages, exa_str)
+                completion = create_fn(messages=new_messages, **create_kwargs)
+                return ExaOpenAICompletion.from_completion(
+                    completion=completion, exa_result=exa_result
+                )
 
-        create_kwargs["tools"] = tools
+        tool_kwargs, create_kwargs = self._tool_call_kwargs(create_kwargs, use_exa)
 
-        completion = create_fn(messages=messages, **create_kwargs)
+        completion = create_fn(messages=messages, **tool_kwargs)
 
         query = maybe_get_query(completion)
 
@@ -1644,15 +2076,102 @@ class Exa:
             )
 
         # We do a search_and_contents automatically
-        exa_result = self.search_and_contents(query, **exa_kwargs)
-        exa_str = format_exa_result(exa_result, max_len=max_len)
+        exa_result, exa_str = self._search_and_format(query, exa_kwargs, max_len)
         new_messages = add_message_to_messages(completion, messages, exa_str)
         completion = create_fn(messages=new_messages, **create_kwargs)
 
-        exa_completion = ExaOpenAICompletion.from_completion(
+        return ExaOpenAICompletion.from_completion(
+            completion=completion, exa_result=exa_result
+        )
+
+    def _cached_search_and_contents(self, query: str, exa_kwargs: dict):
+        """Run search_and_contents for a tool-call query, reusing a cached result when possible.
+
+        `exa_kwargs` were already validated when the wrapped create() was called, so
+        they are sent without being checked again.
+        """
+        options = {"query": query, **exa_kwargs}
+        if CONTENTS_OPTION_KEYS.isdisjoint(options):
+            options["text"] = True
+        response = self._retrieval_cache.get_or_set(
+            SearchResultCache.make_key(query, exa_kwargs),
+            lambda: self._search_and_contents(options),
+        )
+        # Give each completion its own results list so callers reordering or
+        # filtering one `exa_result` don't change what the next cache hit returns.
+        return SearchResponse(
+            list(response.results),
+            response.autoprompt_string,
+            response.resolved_search_type,
+            response.auto_date,
+        )
+
+    def _search_and_format(self, query: str, exa_kwargs: dict, max_len):
+        """Search for `query` and format the results as model context.
+
+        The async path runs this in one worker-thread hop, so formatting the
+        (possibly large) result text stays off the event loop as well.
+        """
+        exa_result = self._cached_search_and_contents(query, exa_kwargs)
+        return exa_result, format_exa_result(exa_result, max_len=max_len)
+
+    async def _acreate_with_tool(
+        self,
+        create_fn: Callable,
+        messages: List[ChatCompletionMessageParam],
+        max_len,
+        create_kwargs,
+        exa_kwargs,
+        use_exa: Optional[Literal["required", "none", "auto"]] = "auto",
+    ) -> ExaOpenAICompletion:
+        """Async counterpart of `_create_with_tool` for wrapped AsyncOpenAI clients.
+
+        The Exa search, and formatting its results, runs in a worker thread on the
+        client's pooled session, so the event loop keeps driving other completions
+        while it waits on the network.
+        """
+        from exa_py.completion import ExaOpenAICompletion
+
+        if use_exa == "none":
+            completion = await create_fn(messages=messages, **create_kwargs)
+            return ExaOpenAICompletion.from_completion(
+                completion=completion, exa_result=None
+            )
+
+        if use_exa == "required":
+            # The last user message is the query, so search first and call the model
+            # once, skipping the tool-call roundtrip.
+            query = maybe_get_last_user_message(messages)
+            if query:
+                exa_result, exa_str = await asyncio.to_thread(
+                    self._search_and_format, query, exa_kwargs, max_len
+                )
+                new_messages = add_context_to_messages(messages, exa_str)
+                completion = await create_fn(messages=new_messages, **create_kwargs)
+                return ExaOpenAICompletion.from_completion(
+                    completion=completion, exa_result=exa_result
+                )
+
+        tool_kwargs, create_kwargs = self._tool_call_kwargs(create_kwargs, use_exa)
+
+        completion = await create_fn(messages=messages, **tool_kwargs)
+
+        query = maybe_get_query(completion)
+
+        if not query:
+            return ExaOpenAICompletion.from_completion(
+                completion=completion, exa_result=None
+            )
+
+        exa_result, exa_str = await asyncio.to_thread(
+            self._search_and_format, query, exa_kwargs, max_len
+        )
+        new_messages = add_message_to_messages(completion, messages, exa_str)
+        completion = await create_fn(messages=new_messages, **create_kwargs)
+
+        return ExaOpenAICompletion.from_completion(
             completion=completion, exa_result=exa_result
         )
-        return exa_completion
 
     @overload
     def answer(
@@ -1689,17 +2208,15 @@ class Exa:
                 "Please use `stream_answer(...)` for streaming."
             )
 
-        options = {
-            k: v
-            for k, v in locals().items()
-            if k != "self" and v is not None
-        }
-        options = to_camel_case(options)
+        # Both keys are already in the API's casing, so no conversion is needed.
+        options = {"query": query}
+        if text:
+            options["text"] = text
         response = self.request("/answer", options)
 
         return AnswerResponse(
             response["answer"],
-            [AnswerResult(**to_snake_case(result)) for result in response["citations"]]
+            [AnswerResult.from_api(result) for result in response["citations"]]
         )
 
     def stream_answer(
@@ -1718,13 +2235,404 @@ class Exa:
             StreamAnswerResponse: An object that can be iterated over to retrieve (partial text, partial citations).
                 Each iteration yields a tuple of (Optional[str], Optional[List[AnswerResult]]).
         """
-        options = {
-            k: v
-            for k, v in locals().items()
-            if k != "self" and v is not None
-        }
-        options = to_camel_case(options)
-        options["stream"] = True
+        options = {"query": query, "stream": True}
+        if text:
+            options["text"] = text
         raw_response = self.request("/answer", options)
         return StreamAnswerResponse(raw_response)
 
+
+class AsyncExa:
+    """An asyncio client for interacting with Exa API.
+
+    Methods take the same arguments as their `Exa` counterparts. Each request runs in
+    a worker thread on an `Exa` client's pooled session, so concurrent calls reuse
+    warm connections without blocking the event loop.
+    """
+
+    def __init__(self, api_key: Optional[str] = None, **kwargs):
+        """Initialize the client; accepts the same arguments as `Exa`."""
+        self.client = Exa(api_key, **kwargs)
+
+    async def search(
+        self,
+        query: str,
+        *,
+        num_results: Optional[int] = None,
+        include_domains: Optional[List[str]] = None,
+        exclude_domains: Optional[List[str]] = None,
+        start_crawl_date: Optional[str] = None,
+        end_crawl_date: Optional[str] = None,
+        start_published_date: Optional[str] = None,
+        end_published_date: Optional[str] = None,
+        include_text: Optional[List[str]] = None,
+        exclude_text: Optional[List[str]] = None,
+        use_autoprompt: Optional[bool] = None,
+        type: Optional[str] = None,
+        category: Optional[str] = None,
+        flags: Optional[List[str]] = None,
+        moderation: Optional[bool] = None,
+    ) -> SearchResponse[_Result]:
+        """Perform a search with a prompt-engineered query to retrieve relevant results.
+
+        Args:
+            query (str): The query string.
+            num_results (int, optional): Number of search results to return (default 10).
+            include_domains (List[str], optional): Domains to include in the search.
+            exclude_domains (List[str], optional): Domains to exclude from the search.
+            start_crawl_date (str, optional): Only links crawled after this date.
+            end_crawl_date (str, optional): Only links crawled before this date.
+            start_published_date (str, optional): Only links published after this date.
+            end_published_date (str, optional): Only links published before this date.
+            include_text (List[str], optional): Strings that must appear in the page text.
+            exclude_text (List[str], optional): Strings that must not appear in the page text.
+            use_autoprompt (bool, optional): Convert query to Exa (default False).
+            type (str, optional): 'keyword' or 'neural' (default 'neural').
+            category (str, optional): e.g. 'company'
+            flags (List[str], optional): Experimental flags for Exa usage.
+            moderation (bool, optional): If True, the search results will be moderated for safety.
+
+        Returns:
+            SearchResponse: The response containing search results, etc.
+        """
+        return await asyncio.to_thread(
+            self.client.search,
+            query,
+            num_results=num_results,
+            include_domains=include_domains,
+            exclude_domains=exclude_domains,
+            start_crawl_date=start_crawl_date,
+            end_crawl_date=end_crawl_date,
+            start_published_date=start_published_date,
+            end_published_date=end_published_date,
+            include_text=include_text,
+            exclude_text=exclude_text,
+            use_autoprompt=use_autoprompt,
+            type=type,
+            category=category,
+            flags=flags,
+            moderation=moderation,
+        )
+
+    async def search_and_contents(
+        self,
+        query: str,
+        *,
+        text: Union[TextContentsOptions, Literal[True], None] = None,
+        highlights: Union[HighlightsContentsOptions, Literal[True], None] = None,
+        summary: Union[SummaryContentsOptions, Literal[True], None] = None,
+        num_results: Optional[int] = None,
+        include_domains: Optional[List[str]] = None,
+        exclude_domains: Optional[List[str]] = None,
+        start_crawl_date: Optional[str] = None,
+        end_crawl_date: Optional[str] = None,
+        start_published_date: Optional[str] = None,
+        end_published_date: Optional[str] = None,
+        include_text: Optional[List[str]] = None,
+        exclude_text: Optional[List[str]] = None,
+        use_autoprompt: Optional[bool] = None,
+        type: Optional[str] = None,
+        category: Optional[str] = None,
+        flags: Optional[List[str]] = None,
+        moderation: Optional[bool] = None,
+        livecrawl_timeout: Optional[int] = None,
+        livecrawl: Optional[LIVECRAWL_OPTIONS] = None,
+        filter_empty_results: Optional[bool] = None,
+        subpages: Optional[int] = None,
+        subpage_target: Optional[Union[str, List[str]]] = None,
+        extras: Optional[ExtrasOptions] = None,
+    ) -> SearchResponse[Result]:
+        """Search and fetch the contents of each result in one request.
+
+        Args:
+            query (str): The query string.
+            text (TextContentsOptions | True, optional): Include the page text. This is
+                the default when none of text, highlights or summary is given.
+            highlights (HighlightsContentsOptions | True, optional): Include highlights.
+            summary (SummaryContentsOptions | True, optional): Include a summary.
+            num_results (int, optional): Number of search results to return (default 10).
+            include_domains (List[str], optional): Domains to include in the search.
+            exclude_domains (List[str], optional): Domains to exclude from the search.
+            start_crawl_date (str, optional): Only links crawled after this date.
+            end_crawl_date (str, optional): Only links crawled before this date.
+            start_published_date (str, optional): Only links published after this date.
+            end_published_date (str, optional): Only links published before this date.
+            include_text (List[str], optional): Strings that must appear in the page text.
+            exclude_text (List[str], optional): Strings that must not appear in the page text.
+            use_autoprompt (bool, optional): Convert query to Exa (default False).
+            type (str, optional): 'keyword' or 'neural' (default 'neural').
+            category (str, optional): e.g. 'company'
+            flags (List[str], optional): Experimental flags for Exa usage.
+            moderation (bool, optional): If True, the search results will be moderated for safety.
+            livecrawl_timeout (int, optional): Milliseconds to wait for a live crawl.
+            livecrawl (str, optional): 'always', 'fallback', 'never' or 'auto'.
+            filter_empty_results (bool, optional): Drop results without contents.
+            subpages (int, optional): Number of subpages to crawl per result.
+            subpage_target (str | List[str], optional): Terms used to pick subpages.
+            extras (ExtrasOptions, optional): Extra data such as links to include.
+
+        Returns:
+            SearchResponse: The response containing search results with their contents.
+        """
+        return await asyncio.to_thread(
+            self.client.search_and_contents,
+            query,
+            text=text,
+            highlights=highlights,
+            summary=summary,
+            num_results=num_results,
+            include_domains=include_domains,
+            exclude_domains=exclude_domains,
+            start_crawl_date=start_crawl_date,
+            end_crawl_date=end_crawl_date,
+            start_published_date=start_published_date,
+            end_published_date=end_published_date,
+            include_text=include_text,
+            exclude_text=exclude_text,
+            use_autoprompt=use_autoprompt,
+            type=type,
+            category=category,
+            flags=flags,
+            moderation=moderation,
+            livecrawl_timeout=livecrawl_timeout,
+            livecrawl=livecrawl,
+            filter_empty_results=filter_empty_results,
+            subpages=subpages,
+            subpage_target=subpage_target,
+            extras=extras,
+        )
+
+    async def find_similar(
+        self,
+        url: str,
+        *,
+        num_results: Optional[int] = None,
+        include_domains: Optional[List[str]] = None,
+        exclude_domains: Optional[List[str]] = None,
+        start_crawl_date: Optional[str] = None,
+        end_crawl_date: Optional[str] = None,
+        start_published_date: Optional[str] = None,
+        end_published_date: Optional[str] = None,
+        include_text: Optional[List[str]] = None,
+        exclude_text: Optional[List[str]] = None,
+        exclude_source_domain: Optional[bool] = None,
+        category: Optional[str] = None,
+        flags: Optional[List[str]] = None,
+    ) -> SearchResponse[_Result]:
+        """Finds similar pages to a given URL, potentially with domain filters and date filters.
+
+        Args:
+            url (str): The URL to find similar pages for.
+            num_results (int, optional): Number of results to return. Default is None (server default).
+            include_domains (List[str], optional): Domains to include in the search.
+            exclude_domains (List[str], optional): Domains to exclude from the search.
+            start_crawl_date (str, optional): Only links crawled after this date.
+            end_crawl_date (str, optional): Only links crawled before this date.
+            start_published_date (str, optional): Only links published after this date.
+            end_published_date (str, optional): Only links published before this date.
+            include_text (List[str], optional): Strings that must appear in the page text.
+            exclude_text (List[str], optional): Strings that must not appear in the page text.
+            exclude_source_domain (bool, optional): Whether to exclude the source domain.
+            category (str, optional): A data category to focus on.
+            flags (List[str], optional): Experimental flags.
+
+        Returns:
+            SearchResponse[_Result]
+        """
+        return await asyncio.to_thread(
+            self.client.find_similar,
+            url,
+            num_results=num_results,
+            include_domains=include_domains,
+            exclude_domains=exclude_domains,
+            start_crawl_date=start_crawl_date,
+            end_crawl_date=end_crawl_date,
+            start_published_date=start_published_date,
+            end_published_date=end_published_date,
+            include_text=include_text,
+            exclude_text=exclude_text,
+            exclude_source_domain=exclude_source_domain,
+            category=category,
+            flags=flags,
+        )
+
+    async def find_similar_and_contents(
+        self,
+        url: str,
+        *,
+        text: Union[TextContentsOptions, Literal[True], None] = None,
+        highlights: Union[HighlightsContentsOptions, Literal[True], None] = None,
+        summary: Union[SummaryContentsOptions, Literal[True], None] = None,
+        num_results: Optional[int] = None,
+        include_domains: Optional[List[str]] = None,
+        exclude_domains: Optional[List[str]] = None,
+        start_crawl_date: Optional[str] = None,
+        end_crawl_date: Optional[str] = None,
+        start_published_date: Optional[str] = None,
+        end_published_date: Optional[str] = None,
+        include_text: Optional[List[str]] = None,
+        exclude_text: Optional[List[str]] = None,
+        exclude_source_domain: Optional[bool] = None,
+        category: Optional[str] = None,
+        flags: Optional[List[str]] = None,
+        livecrawl_timeout: Optional[int] = None,
+        livecrawl: Optional[LIVECRAWL_OPTIONS] = None,
+        filter_empty_results: Optional[bool] = None,
+        subpages: Optional[int] = None,
+        subpage_target: Optional[Union[str, List[str]]] = None,
+        extras: Optional[ExtrasOptions] = None,
+    ) -> SearchResponse[Result]:
+        """Find pages similar to a URL and fetch the contents of each result in one request.
+
+        Args:
+            url (str): The URL to find similar pages for.
+            text (TextContentsOptions | True, optional): Include the page text. This is
+                the default when none of text, highlights or summary is given.
+            highlights (HighlightsContentsOptions | True, optional): Include highlights.
+            summary (SummaryContentsOptions | True, optional): Include a summary.
+            num_results (int, optional): Number of results to return. Default is None (server default).
+            include_domains (List[str], optional): Domains to include in the search.
+            exclude_domains (List[str], optional): Domains to exclude from the search.
+            start_crawl_date (str, optional): Only links crawled after this date.
+            end_crawl_date (str, optional): Only links crawled before this date.
+            start_published_date (str, optional): Only links published after this date.
+            end_published_date (str, optional): Only links published before this date.
+            include_text (List[str], optional): Strings that must appear in the page text.
+            exclude_text (List[str], optional): Strings that must not appear in the page text.
+            exclude_source_domain (bool, optional): Whether to exclude the source domain.
+            category (str, optional): A data category to focus on.
+            flags (List[str], optional): Experimental flags.
+            livecrawl_timeout (int, optional): Milliseconds to wait for a live crawl.
+            livecrawl (str, optional): 'always', 'fallback', 'never' or 'auto'.
+            filter_empty_results (bool, optional): Drop results without contents.
+            subpages (int, optional): Number of subpages to crawl per result.
+            subpage_target (str | List[str], optional): Terms used to pick subpages.
+            extras (ExtrasOptions, optional): Extra data such as links to include.
+
+        Returns:
+            SearchResponse: The response containing similar pages with their contents.
+        """
+        return await asyncio.to_thread(
+            self.client.find_similar_and_contents,
+            url,
+            text=text,
+            highlights=highlights,
+            summary=summary,
+            num_results=num_results,
+            include_domains=include_domains,
+            exclude_domains=exclude_domains,
+            start_crawl_date=start_crawl_date,
+            end_crawl_date=end_crawl_date,
+            start_published_date=start_published_date,
+            end_published_date=end_published_date,
+            include_text=include_text,
+            exclude_text=exclude_text,
+            exclude_source_domain=exclude_source_domain,
+            category=category,
+            flags=flags,
+            livecrawl_timeout=livecrawl_timeout,
+            livecrawl=livecrawl,
+            filter_empty_results=filter_empty_results,
+            subpages=subpages,
+            subpage_target=subpage_target,
+            extras=extras,
+        )
+
+    async def get_contents(
+        self,
+        urls: Union[str, Iterable[str], Iterable[_Result]],
+        *,
+        text: Union[TextContentsOptions, Literal[True], None] = None,
+        highlights: Union[HighlightsContentsOptions, Literal[True], None] = None,
+        summary: Union[SummaryContentsOptions, Literal[True], None] = None,
+        livecrawl_timeout: Optional[int] = None,
+        livecrawl: Optional[LIVECRAWL_OPTIONS] = None,
+        filter_empty_results: Optional[bool] = None,
+        subpages: Optional[int] = None,
+        subpage_target: Optional[Union[str, List[str]]] = None,
+        extras: Optional[ExtrasOptions] = None,
+        flags: Optional[List[str]] = None,
+    ) -> SearchResponse[Result]:
+        """Fetch the contents of the given URLs.
+
+        Args:
+            urls (str | Iterable[str] | Iterable[_Result]): A URL, several URLs, or the
+                results of an earlier search.
+            text (TextContentsOptions | True, optional): Include the page text. This is
+                the default when none of text, highlights or summary is given.
+            highlights (HighlightsContentsOptions | True, optional): Include highlights.
+            summary (SummaryContentsOptions | True, optional): Include a summary.
+            livecrawl_timeout (int, optional): Milliseconds to wait for a live crawl.
+            livecrawl (str, optional): 'always', 'fallback', 'never' or 'auto'.
+            filter_empty_results (bool, optional): Drop results without contents.
+            subpages (int, optional): Number of subpages to crawl per result.
+            subpage_target (str | List[str], optional): Terms used to pick subpages.
+            extras (ExtrasOptions, optional): Extra data such as links to include.
+            flags (List[str], optional): Experimental flags.
+
+        Returns:
+            SearchResponse: One result with contents per URL.
+        """
+        return await asyncio.to_thread(
+            self.client.get_contents,
+            urls,
+            text=text,
+            highlights=highlights,
+            summary=summary,
+            livecrawl_timeout=livecrawl_timeout,
+            livecrawl=livecrawl,
+            filter_empty_results=filter_empty_results,
+            subpages=subpages,
+            subpage_target=subpage_target,
+            extras=extras,
+            flags=flags,
+        )
+
+    async def answer(self, query: str, *, text: bool = False) -> AnswerResponse:
+        """Generate an answer to a query using Exa's search and LLM capabilities.
+
+        Args:
+            query (str): The query to answer.
+            text (bool, optional): Whether to include full text in the results. Defaults to False.
+
+        Returns:
+            AnswerResponse: An object containing the answer and citations.
+        """
+        return await asyncio.to_thread(self.client.answer, query, text=text)
+
+    async def stream_answer(
+        self, query: str, *, text: bool = False
+    ) -> AsyncIterator[StreamChunk]:
+        """Generate a streaming answer response.
+
+        The response is read in a worker thread one chunk at a time, so the event loop
+        is never blocked waiting on the stream.
+
+        Args:
+            query (str): The query to answer.
+            text (bool): Whether to include full text in the results. Defaults to False.
+
+        Returns:
+            AsyncIterator[StreamChunk]: Yields chunks of (partial text, partial citations)
+                as they arrive.
+        """
+        response = await asyncio.to_thread(self.client.stream_answer, query, text=text)
+        chunks = iter(response)
+        try:
+            while True:
+                chunk = await asyncio.to_thread(next, chunks, None)
+                if chunk is None:
+                    return
+                yield chunk
+        finally:
+            response.close()
+
+    async def close(self) -> None:
+        """Close the underlying HTTP session and release pooled connections."""
+        self.client.close()
+
+    async def __aenter__(self) -> "AsyncExa":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
@@ -0,0 +1,32 @@
+from typing import TYPE_CHECKING, Optional
+
+from openai.types.chat import ChatCompletion
+
+if TYPE_CHECKING:
+    from exa_py.api import ResultWithText, SearchResponse
+
+
+class ExaOpenAICompletion(ChatCompletion):
+    """Exa wrapper for OpenAI completion."""
+    def __init__(self, exa_result: Optional["SearchResponse[ResultWithText]"], **kwargs):
+        super().__init__(**kwargs)
+        self.exa_result = exa_result
+    
+
+    @classmethod
+    def from_completion(
+        cls, 
+        exa_result: Optional["SearchResponse[ResultWithText]"], 
+        completion: ChatCompletion
+    ):
+
+        return cls(
+            exa_result=exa_result,
+            id=completion.id,
+            choices=completion.choices,
+            created=completion.created,
+            model=completion.model,
+            object=completion.object,
+            system_fingerprint=completion.system_fingerprint,
+            usage=completion.usage,
+        )
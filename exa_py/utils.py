@@ -1,20 +1,22 @@
 import json
-from typing import Optional
-from openai.types.chat import ChatCompletion
-
-from typing import TYPE_CHECKING
-if TYPE_CHECKING:
-    from exa_py.api import ResultWithText, SearchResponse
-
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Optional, Tuple
 
 
 def maybe_get_query(completion) -> Optional[str]:
     """Extract query from completion if it exists."""
-    if completion.choices[0].message.tool_calls:
-        for tool_call in completion.choices[0].message.tool_calls:
-            if tool_call.function.name == "search":
-                query = json.loads(tool_call.function.arguments)["query"]
-                return query
+    # Walk the choices/message/tool_calls chain once. finish_reason is not checked:
+    # it is "stop" rather than "tool_calls" when a tool_choice is forced.
+    tool_calls = completion.choices[0].message.tool_calls
+    if not tool_calls:
+        return None
+    for tool_call in tool_calls:
+        function = tool_call.function
+        if function.name == "search":
+            return json.loads(function.arguments).get("query")
     return None
 
 
@@ -42,37 +44,144 @@ def add_message_to_messages(completion, messages, exa_result) -> list[dict]:
     return messages
 
 
-def format_exa_result(exa_result, max_len: int=-1):
-    """Format exa result for pasting into chat."""
-    str = [
-        f"Url: {result.url}\nTitle: {result.title}\n{result.text[:max_len]}\n"
-        for result in exa_result.results
+def maybe_get_last_user_message(messages) -> Optional[str]:
+    """Return the text of the last message if it was sent by the user."""
+    if not messages:
+        return None
+    message = messages[-1]
+    if not isinstance(message, dict) or message.get("role") != "user":
+        return None
+    content = message.get("content")
+    if isinstance(content, str):
+        return content or None
+    if isinstance(content, list):
+        text = " ".join(
+            part.get("text", "") for part in content if part.get("type") == "text"
+        )
+        return text or None
+    return None
+
+
+def add_context_to_messages(messages, exa_result) -> list[dict]:
+    """Insert exa result as a system message right before the last user message."""
+    return [
+        *messages[:-1],
+        {
+            "role": "system",
+            "content": f"Use these search results to answer the next message:\n\n{exa_result}",
+        },
+        messages[-1],
     ]
 
-    return "\n".join(str)
 
+def format_exa_result(exa_result, max_len: int=-1):
+    """Format exa result for pasting into chat.
+
+    Each result's text is cut to max_len characters; a negative max_len keeps it whole.
+    Results without text (e.g. highlights-only searches) fall back to their highlights.
+    """
+    blocks = []
+    for result in exa_result.results:
+        text = result.text
+        if text is None:
+            text = "\n".join(result.highlights or ())
+        if max_len >= 0:
+            text = text[:max_len]
+        blocks.append(f"Url: {result.url}\nTitle: {result.title}\n{text}\n")
 
-class ExaOpenAICompletion(ChatCompletion):
-    """Exa wrapper for OpenAI completion."""
-    def __init__(self, exa_result: Optional["SearchResponse[ResultWithText]"], **kwargs):
-        super().__init__(**kwargs)
-        self.exa_result = exa_result
-    
+    return "\n".join(blocks)
 
-    @classmethod
-    def from_completion(
-        cls, 
-        exa_result: Optional["SearchResponse[ResultWithText]"], 
-        completion: ChatCompletion
-    ):
-
-        return cls(
-            exa_result=exa_result,
-            id=completion.id,
-            choices=completion.choices,
-            created=completion.created,
-            model=completion.model,
-            object=completion.object,
-            system_fingerprint=completion.system_fingerprint,
-            usage=completion.usage,
-        )
+
+class SearchResultCache:
+    """Thread-safe LRU cache for Exa results, keyed by query and search options."""
+
+    def __init__(self, maxsize: int = 256, ttl: Optional[float] = None):
+        """
+        Args:
+            maxsize (int): Maximum number of entries to keep. 0 disables caching.
+            ttl (float, optional): Seconds after which an entry expires. None keeps entries until evicted.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._pending: Dict[str, Future] = {}
+
+    @staticmethod
+    def make_key(query: str, options: dict) -> str:
+        """Build a cache key from a query and its (JSON-serializable) search options."""
+        return json.dumps([query, options], sort_keys=True, default=str)
+
+    def _lookup(self, key: str) -> Optional[Any]:
+        # Caller must hold self._lock.
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, value = entry
+        if self.ttl is not None and time.monotonic() - stored_at > self.ttl:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for key, or None if it is missing or expired."""
+        with self._lock:
+            return self._lookup(key)
+
+    def set(self, key: str, value: Any) -> None:
+        """Store value under key, evicting the least recently used entries if full."""
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def get_or_set(self, key: str, compute: Callable[[], Any]) -> Any:
+        """Return the cached value for key, calling compute() to fill it on a miss.
+
+        Concurrent misses on the same key share the first caller's result (or
+        exception) instead of computing it again. This holds even when caching is
+        disabled, since calls still in flight are tracked apart from the entries.
+        """
+        with self._lock:
+            value = self._lookup(key)
+            if value is not None:
+                return value
+            pending = self._pending.get(key)
+            if pending is None:
+                pending = self._pending[key] = Future()
+                owner = True
+            else:
+                owner = False
+        if not owner:
+            return pending.result()
+        try:
+            value = compute()
+        except BaseException as exc:
+            pending.set_exception(exc)
+            raise
+        else:
+            self.set(key, value)
+            pending.set_result(value)
+            return value
+        finally:
+            with self._lock:
+                del self._pending[key]
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
+
+def __getattr__(name: str):
+    # ExaOpenAICompletion subclasses an openai type, so it lives in its own module and
+    # openai is only imported once a wrapped client actually needs it.
+    if name == "ExaOpenAICompletion":
+        from exa_py.completion import ExaOpenAICompletion
+
+        return ExaOpenAICompletion
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
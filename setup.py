@@ -13,9 +13,13 @@ setup(
     packages=find_packages(),
     install_requires=[
         "requests",
+        "urllib3>=1.26",
         "typing-extensions",
         "openai>=1.10.0"
     ],
+    extras_require={
+        "fast": ["orjson>=3.9"],
+    },
     classifiers=[
         "Development Status :: 5 - Production/Stable",
         "Intended Audience :: Developers",